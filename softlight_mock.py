@@ -1,14 +1,99 @@
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 import json
+import os
 import re
+import string
 import time
-from typing import Dict, List, Any, Tuple, Optional
+import functools
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, List, Any, Tuple, Optional, Iterator
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class _ClassNameTable(dict):
+    def __missing__(self, codepoint: int) -> str:
+        return '-'
+
+
+_CLASSNAME_ALLOWED = frozenset(string.ascii_letters + string.digits + '-_')
+_CLASSNAME_TRANS = _ClassNameTable(
+    {c: (chr(c) if chr(c) in _CLASSNAME_ALLOWED else '-') for c in range(128)}
+)
+_NAME_DASH_RUNS = re.compile(r'-+')
+
+_BASE_CSS = '\n'.join([
+    "* {",
+    "  margin: 0;",
+    "  padding: 0;",
+    "  box-sizing: border-box;",
+    "}",
+    "",
+    "html, body {",
+    "  margin: 0;",
+    "  padding: 0;",
+    "  width: 100%;",
+    "  height: 100%;",
+    "  overflow-x: hidden;",
+    "}",
+    "",
+    "body {",
+    "  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;",
+    "  position: relative;",
+    "  display: flex;",
+    "  justify-content: center;",
+    "  align-items: center;",
+    "  min-height: 100vh;",
+    "  background-color: rgb(200, 200, 200);",
+    "}",
+    ""
+])
+
+_HTML_PREFIX = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Figma Design Export</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body>
+'''
+_HTML_SUFFIX = '''
+</body>
+</html>'''
+
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _rgba_to_css(r: float, g: float, b: float, a: float) -> str:
+    r = round(r * 255)
+    g = round(g * 255)
+    b = round(b * 255)
+    if a < 1.0:
+        return f"rgba({r}, {g}, {b}, {a})"
+    return f"rgb({r}, {g}, {b})"
+
+
+@dataclass(frozen=True, slots=True)
 class Color:
     r: float
     g: float
@@ -16,40 +101,72 @@ class Color:
     a: float = 1.0
     
     def to_css(self) -> str:
-        
-        r = int(self.r * 255)
-        g = int(self.g * 255)
-        b = int(self.b * 255)
-        if self.a < 1.0:
-            return f"rgba({r}, {g}, {b}, {self.a})"
-        return f"rgb({r}, {g}, {b})"
+        return _rgba_to_css(self.r, self.g, self.b, self.a)
+    
+    def with_alpha(self, a: float) -> 'Color':
+        return Color._make(self.r, self.g, self.b, a)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
+    def _make(r: float, g: float, b: float, a: float) -> 'Color':
+        return Color(r, g, b, a)
     
     @classmethod
     def from_figma(cls, color_dict: Dict) -> 'Color':
-        return cls(
-            r=color_dict.get('r', 0),
-            g=color_dict.get('g', 0),
-            b=color_dict.get('b', 0),
-            a=color_dict.get('a', 1.0)
+        return cls._make(
+            color_dict.get('r', 0),
+            color_dict.get('g', 0),
+            color_dict.get('b', 0),
+            color_dict.get('a', 1.0)
         )
 
 
+def _px(value: float) -> str:
+    integer = int(value)
+    if integer == value:
+        return f"{integer}px"
+    return f"{value}px"
+
+
+def _class_attr(class_name: Optional[str]) -> str:
+    if class_name is None:
+        return ''
+    return f' class="{class_name}"'
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 class FigmaAPI:
     
     BASE_URL = "https://api.figma.com/v1"
     MAX_RETRIES = 5
     INITIAL_BACKOFF = 1
     
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, cache_dir: Optional[str] = None):
         self.access_token = access_token
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.headers = {
             "X-Figma-Token": access_token
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+        self.session.mount('https://', adapter)
     
     def _make_request_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = requests.request(method, url, headers=self.headers, **kwargs)
+                response = self.session.request(method, url, **kwargs)
                 
                 if response.status_code == 429:
                     retry_after = response.headers.get('Retry-After')
@@ -60,6 +177,7 @@ class FigmaAPI:
                     
                     if attempt < self.MAX_RETRIES - 1:
                         print(f"Rate limit hit (429). Waiting {wait_time} seconds before retry {attempt + 1}/{self.MAX_RETRIES}...")
+                        response.close()
                         time.sleep(wait_time)
                         continue
                     else:
@@ -81,8 +199,44 @@ class FigmaAPI:
     
     def get_file(self, file_key: str) -> Dict:
         url = f"{self.BASE_URL}/files/{file_key}"
-        response = self._make_request_with_retry('GET', url)
-        return response.json()
+        if self.cache_dir is None:
+            response = self._make_request_with_retry('GET', url)
+            return _json_loads(response.content)
+        
+        body_path = self.cache_dir / f"{file_key}.json"
+        etag_path = self.cache_dir / f"{file_key}.etag"
+        headers = {}
+        if body_path.exists() and etag_path.exists():
+            headers['If-None-Match'] = etag_path.read_text(encoding='utf-8').strip()
+        
+        response = self._make_request_with_retry('GET', url, headers=headers)
+        if response.status_code == 304:
+            return _json_loads(body_path.read_bytes())
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(body_path, response.content)
+            _write_atomic(etag_path, etag.encode('utf-8'))
+        return _json_loads(response.content)
+    
+    def get_file_streamed(self, file_key: str) -> Iterator[Dict]:
+        if ijson is None:
+            raise ImportError("get_file_streamed requires the 'ijson' package")
+        
+        url = f"{self.BASE_URL}/files/{file_key}"
+        response = self._make_request_with_retry('GET', url, stream=True)
+        response.raw.decode_content = True
+        return self._iter_canvases(response)
+    
+    def _iter_canvases(self, response: requests.Response) -> Iterator[Dict]:
+        with response:
+            try:
+                for page in ijson.items(response.raw, 'document.children.item', use_float=True):
+                    if page.get('type') == 'CANVAS':
+                        yield page
+            except (ijson.JSONError, Urllib3HTTPError, OSError) as e:
+                raise requests.exceptions.RequestException(f"Figma file stream failed: {e}", response=response) from e
     
     def get_images(self, file_key: str, node_ids: List[str], 
                    scale: float = 2.0, format: str = "png") -> Dict:
@@ -93,95 +247,224 @@ class FigmaAPI:
             "format": format
         }
         response = self._make_request_with_retry('GET', url, params=params)
-        return response.json()
+        return _json_loads(response.content)
+    
+    def get_images_batch(self, file_key: str, node_ids: List[str], chunk: int = 100,
+                         concurrency: int = 4, scale: float = 2.0, format: str = "png") -> Dict:
+        if chunk <= 0:
+            raise ValueError(f"chunk must be positive, got {chunk}")
+        if concurrency <= 0:
+            raise ValueError(f"concurrency must be positive, got {concurrency}")
+        
+        merged = {"err": None, "images": {}}
+        batches = [node_ids[i:i + chunk] for i in range(0, len(node_ids), chunk)]
+        if not batches:
+            return merged
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+            futures = [executor.submit(self.get_images, file_key, batch, scale, format) for batch in batches]
+            for future in futures:
+                result = future.result()
+                merged["images"].update(result.get("images") or {})
+                if result.get("err"):
+                    merged["err"] = result["err"]
+        
+        return merged
 
 
 class FigmaToHTMLConverter:
+    _HANDLER_NAMES = {
+        'FRAME': 'process_frame',
+        'GROUP': 'process_group',
+        'RECTANGLE': 'process_rectangle',
+        'ELLIPSE': 'process_ellipse',
+        'TEXT': 'process_text',
+        'VECTOR': 'process_vector',
+        'INSTANCE': 'process_instance',
+        'COMPONENT': 'process_component',
+        'BOOLEAN_OPERATION': 'process_boolean_operation',
+        'STAR': 'process_star',
+        'POLYGON': 'process_polygon',
+        'LINE': 'process_line',
+    }
+    
+    _CHILD_PARENT_TYPES = {
+        'INSTANCE': 'FRAME',
+        'COMPONENT': 'FRAME',
+    }
+    
+    _ROOT_FRAME_TYPES = frozenset({'FRAME', 'COMPONENT', 'INSTANCE'})
+    
+    _GRADIENT_TYPES = frozenset({'GRADIENT_LINEAR', 'GRADIENT_RADIAL', 'GRADIENT_ANGULAR'})
+    
+    _BACKGROUND_FILL_TYPES = _GRADIENT_TYPES | {'SOLID'}
+    
+    _TEXT_ALIGNS = frozenset({'left', 'center', 'right', 'justified'})
+    
+    _CORNER_KEYS = ('rectangleTopLeftCornerRadius', 'rectangleTopRightCornerRadius',
+                    'rectangleBottomRightCornerRadius', 'rectangleBottomLeftCornerRadius')
+    
+    _PRIMARY_ALIGN = {
+        'MIN': 'flex-start',
+        'CENTER': 'center',
+        'MAX': 'flex-end',
+        'SPACE_BETWEEN': 'space-between'
+    }
+    
+    _COUNTER_ALIGN = {
+        'MIN': 'flex-start',
+        'CENTER': 'center',
+        'MAX': 'flex-end',
+        'BASELINE': 'baseline'
+    }
+    
+    _LINE_HEIGHT_RULES = {
+        'lineHeightPx': lambda s: _px(s['lineHeightPx']),
+        'lineHeightPercent': lambda s: f"{s['lineHeightPercent']}%",
+        'lineHeightPercentFontSize': lambda s: _px(s.get('fontSize', 16) * s['lineHeightPercentFontSize'] / 100),
+    }
+    
+    _TEXT_CASE_MAP = {
+        'upper': 'uppercase',
+        'lower': 'lowercase',
+        'title': 'capitalize'
+    }
+    
+    _BLEND_MODE_MAP = {
+        'PASS_THROUGH': 'normal',
+        'MULTIPLY': 'multiply',
+        'SCREEN': 'screen',
+        'OVERLAY': 'overlay',
+        'DARKEN': 'darken',
+        'LIGHTEN': 'lighten',
+        'COLOR_DODGE': 'color-dodge',
+        'COLOR_BURN': 'color-burn',
+        'HARD_LIGHT': 'hard-light',
+        'SOFT_LIGHT': 'soft-light',
+        'DIFFERENCE': 'difference',
+        'EXCLUSION': 'exclusion',
+        'HUE': 'hue',
+        'SATURATION': 'saturation',
+        'COLOR': 'color',
+        'LUMINOSITY': 'luminosity'
+    }
+    
     def __init__(self, figma_data: Dict):
         self.figma_data = figma_data
         self.document = figma_data.get('document', {})
         self.components = figma_data.get('components', {})
         self.styles = figma_data.get('styles', {})
-        self.css_classes = []
+        self.css_classes: List[str] = []
+        self._style_to_class = {}
         self.class_counter = 0
-        self.fonts_used = set()
+        self.fonts_used: Dict[str, None] = {}
+        self._fonts_import = ''
+        self._fonts_import_size = 0
         self.root_frame_bbox = None  
-        self.node_positions = {}
+        self._node_id_to_idx: Dict[str, int] = {}
+        self._node_xy = array('d')
+        self._node_wh = array('d')
+        self._html_chunks = []
     
     def convert(self) -> Tuple[str, str]:
-        html_parts = []
-        
-        for page in self.document.get('children', []):
-            if page.get('type') == 'CANVAS':
-                page_html = self.process_canvas(page)
-                if page_html:
-                    html_parts.append(page_html)
-        
-        html = self.build_html_document('\n'.join(html_parts))
+        html = self.build_html_document('\n'.join(self.iter_pages()))
         css = self.build_css()
         
         return html, css
     
-    def process_canvas(self, canvas: Dict) -> str:
-        html_parts = []
-        
-        for child in canvas.get('children', []):
-            if child.get('type') in ['FRAME', 'COMPONENT', 'INSTANCE']:
-                bbox = child.get('absoluteBoundingBox', {})
-                if bbox:
-                    if self.root_frame_bbox is None:
-                        self.root_frame_bbox = bbox
-                    else:
-                        current_area = bbox.get('width', 0) * bbox.get('height', 0)
-                        root_area = self.root_frame_bbox.get('width', 0) * self.root_frame_bbox.get('height', 0)
-                        if current_area > root_area:
-                            self.root_frame_bbox = bbox
-                    break
-        
-        for child in canvas.get('children', []):
-            child_html = self.process_node(child, None, None)
-            if child_html:
-                html_parts.append(child_html)
+    def iter_pages(self) -> Iterator[str]:
+        for page in self.document.get('children', []):
+            if page.get('type') != 'CANVAS':
+                continue
+            
+            self._html_chunks = []
+            self.clear_node_positions()
+            self.process_canvas(page)
+            if self._html_chunks:
+                yield ''.join(self._html_chunks)
         
-        return '\n'.join(html_parts)
+        self._html_chunks = []
     
-    def process_node(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        node_type = node.get('type')
-        
+    def node_position(self, node_id: str) -> Optional[Tuple[float, float, float, float]]:
+        idx = self._node_id_to_idx.get(node_id)
+        if idx is None:
+            return None
+        return (self._node_xy[2 * idx], self._node_xy[2 * idx + 1],
+                self._node_wh[2 * idx], self._node_wh[2 * idx + 1])
+    
+    def clear_node_positions(self):
+        self._node_id_to_idx.clear()
+        del self._node_xy[:]
+        del self._node_wh[:]
+    
+    def process_canvas(self, canvas: Dict):
+        top_frames = canvas.get('children', [])
+        frame_bboxes = (c['absoluteBoundingBox'] for c in top_frames
+                        if c.get('type') in self._ROOT_FRAME_TYPES and c.get('absoluteBoundingBox'))
+        if self.root_frame_bbox is not None:
+            frame_bboxes = chain((self.root_frame_bbox,), frame_bboxes)
+        self.root_frame_bbox = max(frame_bboxes, key=lambda b: b.get('width', 0) * b.get('height', 0), default=None)
+        
+        chunks = self._html_chunks
+        start = len(chunks)
+        for child in top_frames:
+            separated = len(chunks) > start
+            if separated:
+                chunks.append('\n')
+            mark = len(chunks)
+            self.process_node(child)
+            if separated and len(chunks) == mark:
+                chunks.pop()
+    
+    def process_node(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         if not node.get('visible', True):
-            return ''
-        
-        node_bbox = node.get('absoluteBoundingBox', {})
-        if node_bbox:
-            node_id = node.get('id', '')
-            self.node_positions[node_id] = node_bbox
-        
-        handlers = {
-            'FRAME': self.process_frame,
-            'GROUP': self.process_group,
-            'RECTANGLE': self.process_rectangle,
-            'ELLIPSE': self.process_ellipse,
-            'TEXT': self.process_text,
-            'VECTOR': self.process_vector,
-            'INSTANCE': self.process_instance,
-            'COMPONENT': self.process_component,
-            'BOOLEAN_OPERATION': self.process_boolean_operation,
-            'STAR': self.process_star,
-            'POLYGON': self.process_polygon,
-            'LINE': self.process_line,
-        }
-        
-        handler = handlers.get(node_type)
-        if handler:
-            return handler(node, parent_type, parent_bbox)
+            return
         
-        if 'children' in node:
-            return self.process_container(node, parent_type, parent_bbox)
+        chunks = self._html_chunks
+        stack = deque([(node, parent_type, parent_bbox)])
         
-        return ''
+        while stack:
+            entry = stack.pop()
+            if isinstance(entry, str):
+                chunks.append(entry)
+                continue
+            
+            current, current_parent_type, current_parent_bbox = entry
+            
+            node_bbox = current.get('absoluteBoundingBox', {})
+            if node_bbox:
+                node_id = current.get('id', '')
+                x, y = node_bbox.get('x', 0), node_bbox.get('y', 0)
+                w, h = node_bbox.get('width', 0), node_bbox.get('height', 0)
+                idx = self._node_id_to_idx.get(node_id)
+                if idx is None:
+                    self._node_id_to_idx[node_id] = len(self._node_id_to_idx)
+                    self._node_xy.extend((x, y))
+                    self._node_wh.extend((w, h))
+                else:
+                    self._node_xy[2 * idx], self._node_xy[2 * idx + 1] = x, y
+                    self._node_wh[2 * idx], self._node_wh[2 * idx + 1] = w, h
+            
+            node_type = current.get('type')
+            handler_name = self._HANDLER_NAMES.get(node_type)
+            if handler_name is None:
+                if 'children' not in current:
+                    continue
+                handler_name = 'process_container'
+            
+            tags = getattr(self, handler_name)(current, current_parent_type, current_parent_bbox)
+            if tags is None:
+                continue
+            
+            open_str, close_str = tags
+            chunks.append(open_str)
+            stack.append(close_str)
+            child_parent_type = self._CHILD_PARENT_TYPES.get(node_type, node_type)
+            for child in reversed(current.get('children', ())):
+                if child.get('visible', True):
+                    stack.append((child, child_parent_type, node_bbox))
     
-    def process_frame(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'frame'))
+    def process_frame(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> Tuple[str, str]:
         node_bbox = node.get('absoluteBoundingBox', {})
         
         is_root_frame = False
@@ -214,29 +497,16 @@ class FigmaToHTMLConverter:
         self.add_layout_properties(node, styles)
         
         if 'border-radius' not in styles:
-            corner_radius = node.get('cornerRadius', 0)
-            if corner_radius:
-                styles['border-radius'] = f'{corner_radius}px'
-            
-            individual_radii = []
-            for corner in ['rectangleTopLeftCornerRadius', 'rectangleTopRightCornerRadius',
-                          'rectangleBottomRightCornerRadius', 'rectangleBottomLeftCornerRadius']:
-                radius = node.get(corner)
-                if radius is not None:
-                    individual_radii.append(f'{radius}px')
-            
-            if len(individual_radii) == 4:
-                styles['border-radius'] = ' '.join(individual_radii)
+            self.add_corner_radius(node, styles)
         
-        children_html = []
         has_children = bool(node.get('children', []))
         
         fills = node.get('fills', [])
-        has_gradient = any(f.get('type') in ['GRADIENT_LINEAR', 'GRADIENT_RADIAL', 'GRADIENT_ANGULAR'] 
-                          for f in fills if f.get('visible', True))
-        has_solid_bg = any(f.get('type') == 'SOLID' for f in fills if f.get('visible', True))
+        has_background = has_children and any(
+            f.get('type') in self._BACKGROUND_FILL_TYPES
+            for f in fills if f.get('visible', True))
         
-        if (has_gradient or has_solid_bg) and has_children:
+        if has_background:
             if 'display' not in styles:
                 styles['display'] = 'flex'
             if 'justify-content' not in styles:
@@ -248,73 +518,33 @@ class FigmaToHTMLConverter:
             if 'position' not in styles:
                 styles['position'] = 'relative'
         
-        for child in node.get('children', []):
-            child_html = self.process_node(child, 'FRAME', node_bbox)
-            if child_html:
-                children_html.append(child_html)
-        
-        self.add_css_class(class_name, styles)
+        class_name = self.register_class(node.get('name', 'frame'), styles)
         
-        tag = 'div'
-        return f'<{tag} class="{class_name}">\n{"".join(children_html)}</{tag}>'
+        return f'<div{_class_attr(class_name)}>\n', '</div>'
     
-    def process_group(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'group'))
-        node_bbox = node.get('absoluteBoundingBox', {})
+    def process_group(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> Tuple[str, str]:
         styles = self.extract_node_styles(node, parent_bbox, False, include_bg=False)
+        class_name = self.register_class(node.get('name', 'group'), styles)
         
-        children_html = []
-        for child in node.get('children', []):
-            child_html = self.process_node(child, 'GROUP', node_bbox)
-            if child_html:
-                children_html.append(child_html)
-        
-        self.add_css_class(class_name, styles)
-        
-        return f'<div class="{class_name}">\n{"".join(children_html)}</div>'
+        return f'<div{_class_attr(class_name)}>\n', '</div>'
     
-    def process_rectangle(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'rectangle'))
+    def process_rectangle(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> Tuple[str, str]:
         styles = self.extract_node_styles(node, parent_bbox)
+        self.add_corner_radius(node, styles)
         
-        corner_radius = node.get('cornerRadius', 0)
-        if corner_radius:
-            styles['border-radius'] = f'{corner_radius}px'
-        
-        individual_radii = []
-        for corner in ['rectangleTopLeftCornerRadius', 'rectangleTopRightCornerRadius',
-                      'rectangleBottomRightCornerRadius', 'rectangleBottomLeftCornerRadius']:
-            radius = node.get(corner)
-            if radius is not None:
-                individual_radii.append(f'{radius}px')
-        
-        if len(individual_radii) == 4:
-            styles['border-radius'] = ' '.join(individual_radii)
+        class_name = self.register_class(node.get('name', 'rectangle'), styles)
         
-        self.add_css_class(class_name, styles)
-        
-        node_bbox = node.get('absoluteBoundingBox', {})
-        children_html = []
-        for child in node.get('children', []):
-            child_html = self.process_node(child, 'RECTANGLE', node_bbox)
-            if child_html:
-                children_html.append(child_html)
-        
-        if children_html:
-            return f'<div class="{class_name}">{"".join(children_html)}</div>'
-        return f'<div class="{class_name}"></div>'
-    
-    def process_ellipse(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'ellipse'))
+        return f'<div{_class_attr(class_name)}>', '</div>'
+    
+    def process_ellipse(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         styles = self.extract_node_styles(node, parent_bbox)
         styles['border-radius'] = '50%'
         
-        self.add_css_class(class_name, styles)
+        class_name = self.register_class(node.get('name', 'ellipse'), styles)
         
-        return f'<div class="{class_name}"></div>'
+        self._html_chunks.append(f'<div{_class_attr(class_name)}></div>')
     
-    def process_text(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'text'))
+    def process_text(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         styles = self.extract_node_styles(node, parent_bbox, False, include_bg=False)
         
         style = node.get('style', {})
@@ -331,11 +561,11 @@ class FigmaToHTMLConverter:
         
         if 'fontFamily' in style:
             font_family = style['fontFamily']
-            self.fonts_used.add(font_family)
+            self.fonts_used[font_family] = None
             styles['font-family'] = f'"{font_family}", sans-serif'
         
         if 'fontSize' in style:
-            styles['font-size'] = f"{style['fontSize']}px"
+            styles['font-size'] = _px(style['fontSize'])
         
         if 'fontWeight' in style:
             styles['font-weight'] = str(style['fontWeight'])
@@ -353,22 +583,18 @@ class FigmaToHTMLConverter:
                 if letter_spacing.get('unit') == 'PERCENT':
                     styles['letter-spacing'] = f"{letter_spacing['value'] / 100}em"
                 else:
-                    styles['letter-spacing'] = f"{letter_spacing['value']}px"
+                    styles['letter-spacing'] = _px(letter_spacing['value'])
             else:
-                styles['letter-spacing'] = f"{letter_spacing}px"
+                styles['letter-spacing'] = _px(letter_spacing)
         
-        if 'lineHeightPx' in style:
-            styles['line-height'] = f"{style['lineHeightPx']}px"
-        elif 'lineHeightPercent' in style:
-            styles['line-height'] = f"{style['lineHeightPercent']}%"
-        elif 'lineHeightPercentFontSize' in style:
-            font_size = style.get('fontSize', 16)
-            line_height_percent = style['lineHeightPercentFontSize']
-            styles['line-height'] = f"{font_size * line_height_percent / 100}px"
+        for key, line_height in self._LINE_HEIGHT_RULES.items():
+            if key in style:
+                styles['line-height'] = line_height(style)
+                break
         
         if 'textAlignHorizontal' in style:
             align = style['textAlignHorizontal'].lower()
-            if align in ['left', 'center', 'right', 'justified']:
+            if align in self._TEXT_ALIGNS:
                 styles['text-align'] = 'justify' if align == 'justified' else align
                 if align == 'center':
                     if 'left' in styles:
@@ -386,25 +612,19 @@ class FigmaToHTMLConverter:
                 styles['text-decoration'] = decoration.replace('_', '-')
         
         if 'textCase' in style:
-            case = style['textCase'].lower()
-            if case == 'upper':
-                styles['text-transform'] = 'uppercase'
-            elif case == 'lower':
-                styles['text-transform'] = 'lowercase'
-            elif case == 'title':
-                styles['text-transform'] = 'capitalize'
+            text_transform = self._TEXT_CASE_MAP.get(style['textCase'].lower())
+            if text_transform:
+                styles['text-transform'] = text_transform
         
         if fills and len(fills) > 0:
             fill = fills[0]
             if fill.get('type') == 'SOLID' and 'color' in fill:
-                color = Color.from_figma(fill['color'])
-                color.a = fill.get('opacity', 1.0)
+                color = Color.from_figma(fill['color']).with_alpha(fill.get('opacity', 1.0))
                 styles['color'] = color.to_css()
         
-        self.add_css_class(class_name, styles)
+        class_name = self.register_class(node.get('name', 'text'), styles)
         
-        text_content = node.get('characters', '')
-        text_content = text_content.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        text_content = node.get('characters', '').translate(_HTML_ESCAPE)
         
         tag = 'span'
         if style.get('fontSize', 0) > 24:
@@ -412,33 +632,31 @@ class FigmaToHTMLConverter:
         elif style.get('fontWeight', 400) >= 600:
             tag = 'strong'
         
-        return f'<{tag} class="{class_name}">{text_content}</{tag}>'
+        self._html_chunks.append(f'<{tag}{_class_attr(class_name)}>{text_content}</{tag}>')
     
-    def process_vector(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'vector'))
+    def process_vector(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         styles = self.extract_node_styles(node, parent_bbox)
         
-        self.add_css_class(class_name, styles)
+        class_name = self.register_class(node.get('name', 'vector'), styles)
         
-        return f'<div class="{class_name}"></div>'
+        self._html_chunks.append(f'<div{_class_attr(class_name)}></div>')
     
-    def process_instance(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
+    def process_instance(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> Tuple[str, str]:
         return self.process_frame(node, parent_type, parent_bbox)
     
-    def process_component(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
+    def process_component(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> Tuple[str, str]:
         return self.process_frame(node, parent_type, parent_bbox)
     
-    def process_boolean_operation(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
+    def process_boolean_operation(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         return self.process_vector(node, parent_type, parent_bbox)
     
-    def process_star(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
+    def process_star(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         return self.process_vector(node, parent_type, parent_bbox)
     
-    def process_polygon(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
+    def process_polygon(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         return self.process_vector(node, parent_type, parent_bbox)
     
-    def process_line(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'line'))
+    def process_line(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None):
         styles = self.extract_node_styles(node, parent_bbox, False, include_bg=False)
         
         strokes = node.get('strokes', [])
@@ -448,24 +666,15 @@ class FigmaToHTMLConverter:
                 color = Color.from_figma(stroke['color'])
                 styles['background-color'] = color.to_css()
         
-        self.add_css_class(class_name, styles)
+        class_name = self.register_class(node.get('name', 'line'), styles)
         
-        return f'<div class="{class_name}"></div>'
+        self._html_chunks.append(f'<div{_class_attr(class_name)}></div>')
     
-    def process_container(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> str:
-        class_name = self.generate_class_name(node.get('name', 'container'))
+    def process_container(self, node: Dict, parent_type: str = None, parent_bbox: Dict = None) -> Tuple[str, str]:
         styles = self.extract_node_styles(node, parent_bbox)
+        class_name = self.register_class(node.get('name', 'container'), styles)
         
-        node_bbox = node.get('absoluteBoundingBox', {})
-        children_html = []
-        for child in node.get('children', []):
-            child_html = self.process_node(child, node.get('type'), node_bbox)
-            if child_html:
-                children_html.append(child_html)
-        
-        self.add_css_class(class_name, styles)
-        
-        return f'<div class="{class_name}">{"".join(children_html)}</div>'
+        return f'<div{_class_attr(class_name)}>', '</div>'
     
     def extract_node_styles(self, node: Dict, parent_bbox: Dict = None, is_root_frame: bool = False, include_bg: bool = True) -> Dict[str, str]:
         styles = {}
@@ -483,11 +692,11 @@ class FigmaToHTMLConverter:
             if is_root_frame:
                 styles['position'] = 'relative'
                 styles['margin'] = '0 auto'
-                styles['width'] = f"{width}px"
-                styles['height'] = f"{height}px"
+                styles['width'] = _px(width)
+                styles['height'] = _px(height)
                 corner_radius = node.get('cornerRadius', 0)
                 if corner_radius:
-                    styles['border-radius'] = f'{corner_radius}px'
+                    styles['border-radius'] = _px(corner_radius)
                 else:
                     styles['border-radius'] = '24px'
                 styles['overflow'] = 'hidden'
@@ -509,34 +718,34 @@ class FigmaToHTMLConverter:
                         if abs(text_center_x - parent_center_x) < 20:
                             styles['position'] = 'absolute'
                             styles['left'] = '50%'
-                            styles['top'] = f"{rel_y}px"
+                            styles['top'] = _px(rel_y)
                             styles['transform'] = 'translateX(-50%)'
                             styles['width'] = 'auto'
-                            styles['height'] = f"{height}px"
+                            styles['height'] = _px(height)
                         else:
                             styles['position'] = 'absolute'
-                            styles['left'] = f"{rel_x}px"
-                            styles['top'] = f"{rel_y}px"
-                            styles['width'] = f"{width}px"
-                            styles['height'] = f"{height}px"
+                            styles['left'] = _px(rel_x)
+                            styles['top'] = _px(rel_y)
+                            styles['width'] = _px(width)
+                            styles['height'] = _px(height)
                     else:
                         styles['position'] = 'absolute'
-                        styles['left'] = f"{rel_x}px"
-                        styles['top'] = f"{rel_y}px"
-                        styles['width'] = f"{width}px"
-                        styles['height'] = f"{height}px"
+                        styles['left'] = _px(rel_x)
+                        styles['top'] = _px(rel_y)
+                        styles['width'] = _px(width)
+                        styles['height'] = _px(height)
                 else:
                     styles['position'] = 'absolute'
-                    styles['left'] = f"{rel_x}px"
-                    styles['top'] = f"{rel_y}px"
-                    styles['width'] = f"{width}px"
-                    styles['height'] = f"{height}px"
+                    styles['left'] = _px(rel_x)
+                    styles['top'] = _px(rel_y)
+                    styles['width'] = _px(width)
+                    styles['height'] = _px(height)
             else:
                 styles['position'] = 'absolute'
-                styles['left'] = f"{x}px"
-                styles['top'] = f"{y}px"
-                styles['width'] = f"{width}px"
-                styles['height'] = f"{height}px"
+                styles['left'] = _px(x)
+                styles['top'] = _px(y)
+                styles['width'] = _px(width)
+                styles['height'] = _px(height)
         
         opacity = node.get('opacity')
         if opacity is not None and opacity < 1.0:
@@ -561,13 +770,16 @@ class FigmaToHTMLConverter:
             if css_blend:
                 styles['mix-blend-mode'] = css_blend
         
-        constraints = node.get('constraints')
-        if constraints:
-            self.process_constraints(constraints, styles)
-        
         return styles
     
     def process_fills(self, fills: List[Dict], styles: Dict[str, str]):
+        if len(fills) == 1:
+            fill = fills[0]
+            if fill.get('type') == 'SOLID' and fill.get('visible', True):
+                color = Color.from_figma(fill['color']).with_alpha(fill.get('opacity', 1.0))
+                styles['background-color'] = color.to_css()
+                return
+        
         visible_fills = [f for f in fills if f.get('visible', True)]
         if not visible_fills:
             return
@@ -577,11 +789,10 @@ class FigmaToHTMLConverter:
             fill_type = fill.get('type')
             
             if fill_type == 'SOLID':
-                color = Color.from_figma(fill['color'])
-                color.a = fill.get('opacity', 1.0)
+                color = Color.from_figma(fill['color']).with_alpha(fill.get('opacity', 1.0))
                 styles['background-color'] = color.to_css()
             
-            elif fill_type in ['GRADIENT_LINEAR', 'GRADIENT_RADIAL', 'GRADIENT_ANGULAR']:
+            elif fill_type in self._GRADIENT_TYPES:
                 gradient = self.create_gradient(fill)
                 if gradient:
                     styles['background'] = gradient
@@ -593,8 +804,7 @@ class FigmaToHTMLConverter:
             backgrounds = []
             for fill in reversed(visible_fills):
                 if fill.get('type') == 'SOLID':
-                    color = Color.from_figma(fill['color'])
-                    color.a = fill.get('opacity', 1.0)
+                    color = Color.from_figma(fill['color']).with_alpha(fill.get('opacity', 1.0))
                     backgrounds.append(color.to_css())
                 elif fill.get('type') in ['GRADIENT_LINEAR', 'GRADIENT_RADIAL']:
                     gradient = self.create_gradient(fill)
@@ -634,26 +844,24 @@ class FigmaToHTMLConverter:
         return None
     
     def process_strokes(self, node: Dict, strokes: List[Dict], styles: Dict[str, str]):
-        visible_strokes = [s for s in strokes if s.get('visible', True)]
-        if not visible_strokes:
+        stroke = next((s for s in strokes if s.get('visible', True)), None)
+        if stroke is None:
             return
         
-        stroke = visible_strokes[0]
         stroke_weight = node.get('strokeWeight', 1)
         stroke_align = node.get('strokeAlign', 'INSIDE')
         
         if stroke.get('type') == 'SOLID':
-            color = Color.from_figma(stroke['color'])
-            color.a = stroke.get('opacity', 1.0)
+            color = Color.from_figma(stroke['color']).with_alpha(stroke.get('opacity', 1.0))
             
             styles['border-style'] = 'solid'
-            styles['border-width'] = f'{stroke_weight}px'
+            styles['border-width'] = _px(stroke_weight)
             styles['border-color'] = color.to_css()
             
             if stroke_align == 'CENTER':
                 pass
             elif stroke_align == 'OUTSIDE':
-                styles['outline'] = f"{stroke_weight}px solid {color.to_css()}"
+                styles['outline'] = f"{_px(stroke_weight)} solid {color.to_css()}"
                 del styles['border-style']
                 del styles['border-width']
                 del styles['border-color']
@@ -678,7 +886,7 @@ class FigmaToHTMLConverter:
                 radius = effect.get('radius', 0)
                 color = Color.from_figma(effect.get('color', {}))
                 
-                shadow = f"{offset_x}px {offset_y}px {radius}px {color.to_css()}"
+                shadow = f"{_px(offset_x)} {_px(offset_y)} {_px(radius)} {color.to_css()}"
                 shadows.append(shadow)
             
             elif effect_type == 'INNER_SHADOW':
@@ -687,20 +895,30 @@ class FigmaToHTMLConverter:
                 radius = effect.get('radius', 0)
                 color = Color.from_figma(effect.get('color', {}))
                 
-                shadow = f"inset {offset_x}px {offset_y}px {radius}px {color.to_css()}"
+                shadow = f"inset {_px(offset_x)} {_px(offset_y)} {_px(radius)} {color.to_css()}"
                 shadows.append(shadow)
             
             elif effect_type == 'LAYER_BLUR':
                 blur_radius = effect.get('radius', 0)
-                styles['filter'] = f"blur({blur_radius}px)"
+                styles['filter'] = f"blur({_px(blur_radius)})"
             
             elif effect_type == 'BACKGROUND_BLUR':
                 blur_radius = effect.get('radius', 0)
-                styles['backdrop-filter'] = f"blur({blur_radius}px)"
+                styles['backdrop-filter'] = f"blur({_px(blur_radius)})"
         
         if shadows:
             styles['box-shadow'] = ', '.join(shadows)
     
+    def add_corner_radius(self, node: Dict, styles: Dict[str, str]):
+        corner_radius = node.get('cornerRadius', 0)
+        if corner_radius:
+            styles['border-radius'] = _px(corner_radius)
+        
+        if any(k in node for k in self._CORNER_KEYS):
+            radii = [_px(node[k]) for k in self._CORNER_KEYS if node.get(k) is not None]
+            if len(radii) == 4:
+                styles['border-radius'] = ' '.join(radii)
+    
     def add_layout_properties(self, node: Dict, styles: Dict[str, str]):
         padding_left = node.get('paddingLeft', 0)
         padding_right = node.get('paddingRight', 0)
@@ -709,62 +927,33 @@ class FigmaToHTMLConverter:
         
         if padding_left or padding_right or padding_top or padding_bottom:
             if padding_left == padding_right == padding_top == padding_bottom:
-                styles['padding'] = f'{padding_left}px'
+                styles['padding'] = _px(padding_left)
             else:
-                styles['padding'] = f'{padding_top}px {padding_right}px {padding_bottom}px {padding_left}px'
+                styles['padding'] = f'{_px(padding_top)} {_px(padding_right)} {_px(padding_bottom)} {_px(padding_left)}'
         
         item_spacing = node.get('itemSpacing')
         if item_spacing:
-            styles['gap'] = f'{item_spacing}px'
+            styles['gap'] = _px(item_spacing)
         
         primary_align = node.get('primaryAxisAlignItems')
         counter_align = node.get('counterAxisAlignItems')
         
         if primary_align:
-            align_map = {
-                'MIN': 'flex-start',
-                'CENTER': 'center',
-                'MAX': 'flex-end',
-                'SPACE_BETWEEN': 'space-between'
-            }
-            styles['justify-content'] = align_map.get(primary_align, 'flex-start')
+            styles['justify-content'] = self._PRIMARY_ALIGN.get(primary_align, 'flex-start')
         
         if counter_align:
-            align_map = {
-                'MIN': 'flex-start',
-                'CENTER': 'center',
-                'MAX': 'flex-end',
-                'BASELINE': 'baseline'
-            }
-            styles['align-items'] = align_map.get(counter_align, 'flex-start')
-    
-    def process_constraints(self, constraints: Dict, styles: Dict[str, str]):
-        pass
+            styles['align-items'] = self._COUNTER_ALIGN.get(counter_align, 'flex-start')
     
     def convert_blend_mode(self, figma_blend: str) -> Optional[str]:
-        blend_map = {
-            'PASS_THROUGH': 'normal',
-            'MULTIPLY': 'multiply',
-            'SCREEN': 'screen',
-            'OVERLAY': 'overlay',
-            'DARKEN': 'darken',
-            'LIGHTEN': 'lighten',
-            'COLOR_DODGE': 'color-dodge',
-            'COLOR_BURN': 'color-burn',
-            'HARD_LIGHT': 'hard-light',
-            'SOFT_LIGHT': 'soft-light',
-            'DIFFERENCE': 'difference',
-            'EXCLUSION': 'exclusion',
-            'HUE': 'hue',
-            'SATURATION': 'saturation',
-            'COLOR': 'color',
-            'LUMINOSITY': 'luminosity'
-        }
-        return blend_map.get(figma_blend)
+        return self._BLEND_MODE_MAP.get(figma_blend)
     
     def generate_class_name(self, name: str) -> str:
-        clean_name = re.sub(r'[^a-zA-Z0-9-_]', '-', name)
-        clean_name = re.sub(r'-+', '-', clean_name)
+        if name.isascii() and name.replace('-', '').replace('_', '').isalnum():
+            clean_name = name
+        else:
+            clean_name = name.translate(_CLASSNAME_TRANS)
+        if '--' in clean_name:
+            clean_name = _NAME_DASH_RUNS.sub('-', clean_name)
         clean_name = clean_name.strip('-').lower()
         
         if clean_name and clean_name[0].isdigit():
@@ -773,65 +962,53 @@ class FigmaToHTMLConverter:
         self.class_counter += 1
         return f'{clean_name}-{self.class_counter}'
     
+    def register_class(self, name: str, styles: Dict[str, str]) -> Optional[str]:
+        if not styles:
+            return None
+        
+        key = frozenset(styles.items())
+        existing = self._style_to_class.get(key)
+        if existing is not None:
+            return existing
+        
+        class_name = self.generate_class_name(name)
+        self._style_to_class[key] = class_name
+        self.add_css_class(class_name, styles)
+        return class_name
+    
     def add_css_class(self, class_name: str, styles: Dict[str, str]):
-        if styles:
-            self.css_classes.append((class_name, styles))
+        body = ''.join([f'  {prop}: {value};\n' for prop, value in styles.items()])
+        self.css_classes.append(f'\n.{class_name} {{\n{body}}}\n')
+    
+    def fonts_import(self) -> str:
+        if self._fonts_import_size != len(self.fonts_used):
+            fonts_query = '|'.join([f.replace(' ', '+') for f in self.fonts_used])
+            self._fonts_import = f"@import url('https://fonts.googleapis.com/css2?family={fonts_query}&display=swap');"
+            self._fonts_import_size = len(self.fonts_used)
+        return self._fonts_import
     
     def build_css(self) -> str:
-        css_parts = [
-            "* {",
-            "  margin: 0;",
-            "  padding: 0;",
-            "  box-sizing: border-box;",
-            "}",
-            "",
-            "html, body {",
-            "  margin: 0;",
-            "  padding: 0;",
-            "  width: 100%;",
-            "  height: 100%;",
-            "  overflow-x: hidden;",
-            "}",
-            "",
-            "body {",
-            "  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;",
-            "  position: relative;",
-            "  display: flex;",
-            "  justify-content: center;",
-            "  align-items: center;",
-            "  min-height: 100vh;",
-            "  background-color: rgb(200, 200, 200);",
-            "}",
-            ""
-        ]
-        
-        if self.fonts_used:
-            fonts_query = '|'.join(f.replace(' ', '+') for f in self.fonts_used)
-            css_parts.insert(0, f"@import url('https://fonts.googleapis.com/css2?family={fonts_query}&display=swap');")
-            css_parts.insert(1, "")
-        
-        for class_name, styles in self.css_classes:
-            css_parts.append(f'.{class_name} {{')
-            for prop, value in styles.items():
-                css_parts.append(f'  {prop}: {value};')
-            css_parts.append('}')
-            css_parts.append('')
-        
-        return '\n'.join(css_parts)
+        prelude = f"{self.fonts_import()}\n\n{_BASE_CSS}" if self.fonts_used else _BASE_CSS
+        return prelude + ''.join(self.css_classes)
     
     def build_html_document(self, body_content: str) -> str:
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Figma Design Export</title>
-    <link rel="stylesheet" href="styles.css">
-</head>
-<body>
-{body_content}
-</body>
-</html>'''
+        return _HTML_PREFIX + body_content + _HTML_SUFFIX
+    
+    def write_html_document(self, path: Path):
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as out:
+                out.write(_HTML_PREFIX.encode('utf-8'))
+                separator = b''
+                for page_html in self.iter_pages():
+                    out.write(separator)
+                    out.write(page_html.encode('utf-8'))
+                    separator = b'\n'
+                out.write(_HTML_SUFFIX.encode('utf-8'))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, path)
 
 
 def main():
@@ -845,6 +1022,8 @@ def main():
         print("\nTo get the file key:")
         print("3. Copy your Figma file to your workspace")
         print("4. Extract the key from the URL: figma.com/file/<FILE_KEY>/...")
+        print("\nSet FIGMA_CACHE_DIR to keep a copy of the file on disk between runs.")
+        print("Set FIGMA_STREAM=1 to parse the file one canvas at a time (requires ijson).")
         sys.exit(1)
     
     access_token = sys.argv[1]
@@ -852,9 +1031,12 @@ def main():
     
     print(f"Fetching Figma file...")
     
-    api = FigmaAPI(access_token)
+    api = FigmaAPI(access_token, cache_dir=os.environ.get('FIGMA_CACHE_DIR'))
     try:
-        figma_data = api.get_file(file_key)
+        if os.environ.get('FIGMA_STREAM'):
+            figma_data = {'document': {'children': api.get_file_streamed(file_key)}}
+        else:
+            figma_data = api.get_file(file_key)
     except Exception as e:
         print(f"Error fetching Figma file: {e}")
         sys.exit(1)
@@ -862,18 +1044,17 @@ def main():
     print("Converting to HTML/CSS...")
     
     converter = FigmaToHTMLConverter(figma_data)
-    html, css = converter.convert()
-    
-    with open('output.html', 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    with open('styles.css', 'w', encoding='utf-8') as f:
-        f.write(css)
+    try:
+        converter.write_html_document(Path('output.html'))
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching Figma file: {e}")
+        sys.exit(1)
+    Path('styles.css').write_bytes(converter.build_css().encode('utf-8'))
     
     print("✓ Conversion complete!")
     print("  - output.html")
     print("  - styles.css")
-    print(f"\nProcessed {len(converter.css_classes)} elements")
+    print(f"\nGenerated {len(converter.css_classes)} CSS rules")
     if converter.fonts_used:
         print(f"Fonts used: {', '.join(converter.fonts_used)}")
 